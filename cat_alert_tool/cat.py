@@ -40,6 +40,17 @@ class Cat:
 
     """
 
+    __slots__ = (
+        "age",
+        "breed",
+        "color",
+        "gender",
+        "id",
+        "image",
+        "name",
+        "url",
+    )
+
     def __init__(self) -> None:
         self.url: str = ""
         self.image: str = ""
@@ -80,25 +91,17 @@ class Cat:
             A human-readable age string.
 
         """
-        days = self.age
-
-        years = days // DAYS_PER_YEAR
-        days %= DAYS_PER_YEAR
-
-        months = days // DAYS_PER_MONTH
-        days %= DAYS_PER_MONTH
-
-        weeks = days // DAYS_PER_WEEK
-        days %= DAYS_PER_WEEK
-
-        parts: list[str] = []
-        if years > 0:
-            parts.append(f"{years} year{'s' if years != 1 else ''}")
-        if months > 0:
-            parts.append(f"{months} month{'s' if months != 1 else ''}")
-        if weeks > 0:
-            parts.append(f"{weeks} week{'s' if weeks != 1 else ''}")
-        if days > 0:
-            parts.append(f"{days} day{'s' if days != 1 else ''}")
-
-        return ", ".join(parts) if len(parts) > 0 else ""
+        years, days = divmod(self.age, DAYS_PER_YEAR)
+        months, days = divmod(days, DAYS_PER_MONTH)
+        weeks, days = divmod(days, DAYS_PER_WEEK)
+
+        return ", ".join(
+            f"{count} {unit}{'s' if count != 1 else ''}"
+            for count, unit in (
+                (years, "year"),
+                (months, "month"),
+                (weeks, "week"),
+                (days, "day"),
+            )
+            if count > 0
+        )
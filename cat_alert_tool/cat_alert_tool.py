@@ -3,11 +3,17 @@
 import argparse
 import logging
 
+import msgspec
 import yaml
 
 from cat_alert_tool.config import Config
 from cat_alert_tool.fetch import get_cats
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
 cat_str = (
     "  /$$$$$$   /$$$$$$  /$$$$$$$$\n"
     " /$$__  $$ /$$__  $$|__  $$__/\n"
@@ -89,12 +95,15 @@ def main() -> None:
     logger = configure_logging(verbose=args.verbose)
     logger.info("\n%s", cat_str)
     logger.info("Starting the Cat Alert Tool...")
-    logger.debug(
-        "Configuration:\n%s",
-        yaml.dump(
-            config.model_dump(warnings="error"), default_flow_style=False
-        ),
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Configuration:\n%s",
+            yaml.dump(
+                msgspec.to_builtins(config),
+                Dumper=SafeDumper,
+                default_flow_style=False,
+            ),
+        )
     _ = get_cats(config)
     logger.info("Exiting script...")
 
@@ -1,42 +1,63 @@
 """Define the CAT configuration functionality."""
 
+from collections import OrderedDict
 from pathlib import Path
+from typing import Annotated
 
-import yaml
-from pydantic import BaseModel, Field
+import msgspec
 
+from cat_alert_tool.constants import CONFIG_CACHE_SIZE
 
-class Requests(BaseModel):
+
+class Requests(msgspec.Struct, frozen=True):
     """Request configuration schema."""
 
-    base_url: str = Field(description="Base URL of the adoption site.")
-    tracking_url: str = Field(description="The URL to query for new cats.")
-    fetch_timeout: float = Field(
-        description="The number of seconds to wait for a response."
-    )
-    fetch_attempts: int = Field(
-        description="The number of times to attempt to fetch new cats."
-    )
-    fetch_sleep: float = Field(
-        description="The number of seconds to wait after a failed fetch "
-        "attempt."
-    )
-
-
-class DB(BaseModel):
+    base_url: Annotated[
+        str, msgspec.Meta(description="Base URL of the adoption site.")
+    ]
+    tracking_url: Annotated[
+        str, msgspec.Meta(description="The URL to query for new cats.")
+    ]
+    fetch_timeout: Annotated[
+        float,
+        msgspec.Meta(
+            description="The number of seconds to wait for a response."
+        ),
+    ]
+    fetch_attempts: Annotated[
+        int,
+        msgspec.Meta(
+            description="The number of times to attempt to fetch new cats."
+        ),
+    ]
+    fetch_sleep: Annotated[
+        float,
+        msgspec.Meta(
+            description="The number of seconds to wait after a failed fetch "
+            "attempt."
+        ),
+    ]
+
+
+class DB(msgspec.Struct, frozen=True):
     """Database configuration schema."""
 
-    db_dir: str = Field(description="Path to the database directory.")
-    db_name: str = Field(description="Database name.")
+    db_dir: Annotated[
+        str, msgspec.Meta(description="Path to the database directory.")
+    ]
+    db_name: Annotated[str, msgspec.Meta(description="Database name.")]
 
 
-class ConfigSchema(BaseModel):
+class ConfigSchema(msgspec.Struct, frozen=True):
     """Top-level configuration schema."""
 
     requests: Requests
     db: DB
 
 
+_cache: OrderedDict[tuple[str, int, int], ConfigSchema] = OrderedDict()
+
+
 class Config:
     """Encapsulate all the configuration options for the CAT.
 
@@ -57,12 +78,26 @@ class Config:
     def parse(self) -> ConfigSchema:
         """Open, parse, and validate the YAML configuration file.
 
+        Parsed configurations are cached by resolved path, modification
+        time, and size, so repeated calls only re-read the file once it
+        has changed on disk.
+
         Returns
         -------
         ConfigSchema
             Parsed and validated configuration object
 
         """
-        with self.file_path.open() as file:
-            raw_data = yaml.safe_load(file)
-            return ConfigSchema(**raw_data)
+        stat = self.file_path.stat()
+        key = (str(self.file_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        if key in _cache:
+            _cache.move_to_end(key)
+            return _cache[key]
+
+        config = msgspec.yaml.decode(
+            self.file_path.read_bytes(), type=ConfigSchema
+        )
+        _cache[key] = config
+        if len(_cache) > CONFIG_CACHE_SIZE:
+            _cache.popitem(last=False)
+        return config
@@ -8,6 +8,8 @@ DAYS_PER_MONTH
     The numer of days per month.
 DAYS_PER_WEEK
     The number of days per week.
+CONFIG_CACHE_SIZE
+    The maximum number of parsed configuration files to keep in memory.
 """
 
 from typing import Final
@@ -16,3 +18,4 @@ DAYS_PER_YEAR: Final[int] = 365
 DAYS_PER_MONTH: Final[int] = 30
 DAYS_PER_WEEK: Final[int] = 7
 TABLE_NAME: Final[str] = "cats"
+CONFIG_CACHE_SIZE: Final[int] = 16
@@ -1,12 +1,48 @@
 """Maintain a cat database that persists script executions."""
 
 import logging
+import sqlite3
 from pathlib import Path
+from types import TracebackType
+from typing import Final, Self
 
-from sqlalchemy import URL, create_engine
+from sqlalchemy import URL, Engine, create_engine, event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import ConnectionPoolEntry
 
 logger = logging.getLogger(__name__)
 
+_SQLITE_PRAGMAS: Final[tuple[str, ...]] = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+)
+
+_engines: dict[Path, Engine] = {}
+_engine_refs: dict[Path, int] = {}
+
+
+def _set_sqlite_pragmas(
+    dbapi_connection: sqlite3.Connection,
+    _connection_record: ConnectionPoolEntry,
+) -> None:
+    """Apply the throughput PRAGMAs to a new SQLite connection.
+
+    Parameters
+    ----------
+    dbapi_connection
+        The raw sqlite3 connection that was just opened.
+    _connection_record
+        The pool entry wrapping the connection (unused).
+
+    """
+    cursor = dbapi_connection.cursor()
+    for pragma in _SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 
 class CatDB:
     """Initialize and interface with the cat database.
@@ -21,17 +57,87 @@ class CatDB:
     """
 
     def __init__(self, db_dir: str, db_name: str) -> None:
-        self._db_dir = Path(db_dir) / db_name
+        self._db_path = Path(db_dir, db_name).expanduser().resolve()
+        self._closed = False
         self._create_engine()
 
     def _create_engine(self) -> None:
-        """Initialize the SQLAlchemy engine."""
-        logger.info("Creating sqlite database engine at %s...", self._db_dir)
-        self.engine = create_engine(
-            URL.create("sqlite+pysqlite", database=str(self._db_dir))
-        )
+        """Initialize the SQLAlchemy engine.
+
+        Engines are shared between every CatDB pointing at the same
+        database file, so the connection pool is only built once. The
+        engine is reference counted and disposed by the last close().
+        """
+        engine = _engines.get(self._db_path)
+        if engine is None:
+            logger.info(
+                "Creating sqlite database engine at %s...", self._db_path
+            )
+            engine = create_engine(
+                URL.create("sqlite+pysqlite", database=str(self._db_path))
+            )
+            event.listen(engine, "connect", _set_sqlite_pragmas)
+            _engines[self._db_path] = engine
+        _engine_refs[self._db_path] = _engine_refs.get(self._db_path, 0) + 1
+        self.engine = engine
+
+    def __enter__(self) -> Self:
+        """Enter the runtime context.
+
+        Returns
+        -------
+        Self
+            This database instance.
+
+        """
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Exit the runtime context and close the DB connection.
+
+        Parameters
+        ----------
+        exc_type
+            The type of the exception raised in the context, if any.
+        exc_value
+            The exception raised in the context, if any.
+        traceback
+            The traceback of the exception, if any.
+
+        """
+        self.close()
 
     def close(self) -> None:
-        """Close the DB connection."""
+        """Close the DB connection.
+
+        The shared engine is only checkpointed and disposed once the
+        last CatDB using it is closed. Closing an instance twice is a
+        no-op. The checkpoint is skipped if the database file was never
+        created, and a failed checkpoint is logged rather than raised.
+        """
+        if self._closed:
+            return
+        self._closed = True
+
+        refs = _engine_refs[self._db_path] - 1
+        if refs > 0:
+            _engine_refs[self._db_path] = refs
+            return
+        del _engine_refs[self._db_path]
+        del _engines[self._db_path]
+
         logger.info("Closing the DB engine...")
+        if self._db_path.exists():
+            try:
+                with self.engine.connect() as connection:
+                    connection.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+            except SQLAlchemyError:
+                logger.exception(
+                    "Could not checkpoint the DB write-ahead log."
+                )
         self.engine.dispose()
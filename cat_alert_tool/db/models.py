@@ -1,24 +1,22 @@
-"""The cat DB model."""
+"""The cat DB table."""
 
-from sqlalchemy import String
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy import Column, Enum, Integer, MetaData, String, Table
 
 from cat_alert_tool.cat import Gender
+from cat_alert_tool.constants import TABLE_NAME
 
+metadata = MetaData()
 
-class Base(DeclarativeBase):
-    """Boiler-plate ORM configuration for SQLAlchemy."""
-
-
-class CatORM(Base):
-    """An ORM mapping for Cat objects to the cat DB."""
-
-    __tablename__ = "cats"
-    id: Mapped[str] = mapped_column(String(7), primary_key=True)
-    name: Mapped[str | None]
-    gender: Mapped[Gender | None]
-    color: Mapped[str | None]
-    breed: Mapped[str | None]
-    age: Mapped[int | None]
-    url: Mapped[str | None]
-    image: Mapped[str | None]
+cats_table = Table(
+    TABLE_NAME,
+    metadata,
+    Column("id", String(7), primary_key=True),
+    Column("name", String),
+    Column("gender", Enum(Gender)),
+    Column("color", String),
+    Column("breed", String),
+    Column("age", Integer),
+    Column("url", String),
+    Column("image", String),
+    sqlite_with_rowid=False,
+)
@@ -1,18 +1,53 @@
 """Get and parse the cats from the tracking URL."""
 
+import codecs
+import functools
 import logging
 import re
-import time
+import sys
 from enum import Enum
+from typing import Final
 
 import requests
+from requests.adapters import HTTPAdapter
 from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util import Retry
 
 from cat_alert_tool.cat import Cat, Gender
-from cat_alert_tool.config import ConfigSchema
+from cat_alert_tool.config import ConfigSchema, Requests
+from cat_alert_tool.constants import (
+    DAYS_PER_MONTH,
+    DAYS_PER_WEEK,
+    DAYS_PER_YEAR,
+)
 
 logger = logging.getLogger(__name__)
 
+_RETRY_STATUS_CODES: Final[tuple[int, ...]] = (500, 502, 503, 504)
+
+_UTF8_COMPATIBLE_CODECS: Final[frozenset[str]] = frozenset({"utf-8", "ascii"})
+_META_UTF8_RE = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?utf-?8", re.IGNORECASE
+)
+_META_PRESCAN_BYTES: Final[int] = 1024
+
+_RESULT_MARKER: Final[bytes] = b"gridResult"
+_RESULT_SELECTOR: Final[str] = "div.gridResult"
+_TEXT_SELECTOR: Final[str] = "div.gridText"
+_LINK_SELECTOR: Final[str] = "a"
+_IMAGE_SELECTOR: Final[str] = "img"
+
+_GENDERS: Final[dict[str, Gender]] = {
+    gender.value: gender for gender in Gender
+}
+
+_AGE_RE = re.compile(r"(\d+)\s*(year|month|week)s?", re.IGNORECASE)
+_DAYS_PER_UNIT: Final[dict[str, int]] = {
+    "year": DAYS_PER_YEAR,
+    "month": DAYS_PER_MONTH,
+    "week": DAYS_PER_WEEK,
+}
+
 
 class TextFields(Enum):
     """Ordering of text fields in the animal div."""
@@ -39,15 +74,16 @@ def parse_name_id_string(name_id_string: str) -> tuple[str, str]:
     str
         The cat's name string in lowercase.
     str
-        The cat's ID string in uppercase.
+        The cat's ID string in uppercase, interned.
 
     """
     name = ""
     id_ = ""
-    match = re.match(r"^(.*)\s\((.*)\)$", name_id_string)
-    if match:
-        name = match.group(1).lower()
-        id_ = match.group(2).upper()
+    if name_id_string.endswith(")"):
+        head, sep, tail = name_id_string.rpartition(" (")
+        if sep:
+            name = head.lower()
+            id_ = sys.intern(tail[:-1].upper())
     return name, id_
 
 
@@ -65,10 +101,7 @@ def parse_gender_string(gender_string: str) -> Gender | None:
         The cat's gender, if parsable otherwise None.
 
     """
-    try:
-        return Gender(gender_string.lower())
-    except ValueError:
-        return None
+    return _GENDERS.get(gender_string.lower())
 
 
 def parse_cat_age_string(cat_age_string: str) -> int:
@@ -85,27 +118,12 @@ def parse_cat_age_string(cat_age_string: str) -> int:
         The age of the cat in days. If unparsable, returns 0.
 
     """
-    days_per_year = 365
-    days_per_month = 30
-    days_per_week = 7
-    age = 0
-    cat_age_string = cat_age_string.replace("old", "").strip().lower()
-
-    year_pattern = r"(\d+)\s*year(?:s)?"
-    month_pattern = r"(\d+)\s*month(?:s)?"
-    week_pattern = r"(\d+)\s*week(?:s)?"
-
-    match = re.search(year_pattern, cat_age_string)
-    if match:
-        age += int(match.group(1)) * days_per_year
-
-    match = re.search(month_pattern, cat_age_string)
-    if match:
-        age += int(match.group(1)) * days_per_month
+    if not cat_age_string:
+        return 0
 
-    match = re.search(week_pattern, cat_age_string)
-    if match:
-        age += int(match.group(1)) * days_per_week
+    age = 0
+    for match in _AGE_RE.finditer(cat_age_string):
+        age += int(match.group(1)) * _DAYS_PER_UNIT[match.group(2).lower()]
 
     return age
 
@@ -128,19 +146,17 @@ def parse_cat_div(base_url: str, cat_div: LexborNode) -> Cat:
     """
     cat = Cat()
 
-    a_node = cat_div.css_first("a")
-    if a_node:
-        href = a_node.attributes["href"]
-        if href:
-            cat.url = base_url + href
+    a_node = cat_div.css_first(_LINK_SELECTOR)
+    href = a_node.attributes.get("href") if a_node else None
+    if href:
+        cat.url = base_url + href
 
-    img_node = cat_div.css_first("img")
-    if img_node:
-        src = img_node.attributes["src"]
-        if src:
-            cat.image = base_url + src
+    img_node = cat_div.css_first(_IMAGE_SELECTOR)
+    src = img_node.attributes.get("src") if img_node else None
+    if src:
+        cat.image = base_url + src
 
-    text_nodes = cat_div.css("div.gridText")
+    text_nodes = cat_div.css(_TEXT_SELECTOR)
     if text_nodes:
         cat.name, cat.id = parse_name_id_string(
             text_nodes[TextFields.NAME_ID.value].text(strip=True)
@@ -157,6 +173,88 @@ def parse_cat_div(base_url: str, cat_div: LexborNode) -> Cat:
     return cat
 
 
+class _FixedDelayRetry(Retry):
+    """A retry policy that waits the same time after every failure."""
+
+    def get_backoff_time(self) -> float:
+        """Return the fixed delay before the next retry.
+
+        Returns
+        -------
+        float
+            The backoff factor, in seconds.
+
+        """
+        return self.backoff_factor
+
+
+@functools.cache
+def _get_session(request_config: Requests) -> requests.Session:
+    """Return the pooled session used to fetch the tracking URL.
+
+    Failed requests are retried inside the connection pool, waiting
+    ``fetch_sleep`` seconds after each failure, so transient errors
+    reuse the open connection instead of starting a new handshake.
+
+    Parameters
+    ----------
+    request_config
+        The request configuration to build the retry policy from.
+
+    Returns
+    -------
+    Session
+        A session shared by every fetch with the same configuration.
+
+    """
+    retry = _FixedDelayRetry(
+        total=max(request_config.fetch_attempts - 1, 0),
+        backoff_factor=request_config.fetch_sleep,
+        status_forcelist=_RETRY_STATUS_CODES,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=2, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _get_markup(response: requests.Response) -> str | bytes:
+    """Return the response body in the cheapest form Lexbor can parse.
+
+    Lexbor always reads bytes as UTF-8, so the raw body is only passed
+    through when the response is known to be UTF-8 compatible, either
+    from its declared charset or, if none is declared, from a UTF-8
+    meta tag. Otherwise the body is decoded by requests.
+
+    Parameters
+    ----------
+    response
+        The response from the tracking URL.
+
+    Returns
+    -------
+    str | bytes
+        The raw body if it is UTF-8 compatible, otherwise the decoded
+        text.
+
+    """
+    body = response.content
+    if response.encoding is None:
+        if _META_UTF8_RE.search(body, 0, _META_PRESCAN_BYTES):
+            return body
+        return response.text
+
+    try:
+        codec = codecs.lookup(response.encoding).name
+    except LookupError:
+        return response.text
+    return body if codec in _UTF8_COMPATIBLE_CODECS else response.text
+
+
 def get_cats(config: ConfigSchema) -> list[Cat]:
     """Get all the cats from the tracking URL.
 
@@ -174,35 +272,29 @@ def get_cats(config: ConfigSchema) -> list[Cat]:
     logger.info("Beginning the cat fetching routine...")
     cats: list[Cat] = []
 
-    response = None
-    attempts = 0
-    while attempts < config.requests.fetch_attempts:
-        try:
-            logger.info("Fetching cats...")
-            logger.debug("Fetching from: %s", config.requests.tracking_url)
-            response = requests.get(
-                config.requests.tracking_url,
-                timeout=config.requests.fetch_timeout,
-            )
-            response.raise_for_status()
-            break
-        except requests.RequestException:
-            logger.exception("HTTP error caught while fetching tracking URL.")
-        logger.info(
-            "Failed to fetch cats. Sleeping for %f seconds...",
-            config.requests.fetch_timeout,
+    try:
+        logger.info("Fetching cats...")
+        logger.debug("Fetching from: %s", config.requests.tracking_url)
+        response = _get_session(config.requests).get(
+            config.requests.tracking_url,
+            timeout=config.requests.fetch_timeout,
         )
-        time.sleep(config.requests.fetch_sleep)
-        attempts += 1
+        response.raise_for_status()
+    except requests.RequestException:
+        logger.exception("HTTP error caught while fetching tracking URL.")
+        logger.critical("Could not fetch cats from tracking URL.")
+        return []
 
-    if response is None or attempts == config.requests.fetch_attempts:
-        logging.critical("Could not fetch cats from tracking URL.")
+    body = response.content
+    if _RESULT_MARKER not in body:
+        logger.info("Found 0 cats!")
         return []
 
-    selector = "div.gridResult"
-    for div in LexborHTMLParser(response.text).css(selector):
+    debug = logger.isEnabledFor(logging.DEBUG)
+    for div in LexborHTMLParser(_get_markup(response)).css(_RESULT_SELECTOR):
         cat = parse_cat_div(config.requests.base_url, div)
-        logger.debug("Cat parsed:\n%s\n", cat)
+        if debug:
+            logger.debug("Cat parsed:\n%s\n", cat)
         cats.append(cat)
 
     logger.info("Found %d cats!", len(cats))
@@ -0,0 +1,22 @@
+"""Cat tests."""
+
+import pytest
+
+from cat_alert_tool.cat import Cat
+
+
+@pytest.mark.parametrize(
+    ("age", "expected"),
+    [
+        (0, ""),
+        (1, "1 day"),
+        (8, "1 week, 1 day"),
+        (400, "1 year, 1 month, 5 days"),
+        (800, "2 years, 2 months, 1 week, 3 days"),
+    ],
+)
+def test_get_human_readable_age(age: int, expected: str):
+    cat = Cat()
+    cat.age = age
+
+    assert cat.get_human_readable_age() == expected
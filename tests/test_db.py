@@ -1 +1,58 @@
 """Database tests."""
+
+from pathlib import Path
+
+import pytest
+
+from cat_alert_tool.db.database import CatDB
+
+
+class BodyError(Exception):
+    pass
+
+
+def test_close_unused_db_does_not_create_file(tmp_path: Path):
+    CatDB(str(tmp_path), "cats.db").close()
+
+    assert not (tmp_path / "cats.db").exists()
+
+
+def test_close_twice_is_noop(tmp_path: Path):
+    db = CatDB(str(tmp_path), "cats.db")
+    db.close()
+    db.close()
+
+
+def test_exit_keeps_original_exception_for_missing_dir(tmp_path: Path):
+    with (
+        pytest.raises(BodyError),
+        CatDB(str(tmp_path / "missing"), "cats.db"),
+    ):
+        raise BodyError
+
+
+def test_exit_keeps_original_exception_when_checkpoint_fails(
+    tmp_path: Path,
+):
+    (tmp_path / "cats.db").mkdir()
+
+    with (
+        pytest.raises(BodyError),
+        CatDB(str(tmp_path), "cats.db"),
+    ):
+        raise BodyError
+
+
+def test_engine_shared_until_last_close(tmp_path: Path):
+    first = CatDB(str(tmp_path), "cats.db")
+    second = CatDB(str(tmp_path), "cats.db")
+    assert first.engine is second.engine
+
+    first.close()
+    with second.engine.connect():
+        pass
+    second.close()
+
+    third = CatDB(str(tmp_path), "cats.db")
+    assert third.engine is not second.engine
+    third.close()
@@ -0,0 +1,220 @@
+"""Fetch tests."""
+
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from pytest_mock import MockerFixture
+
+from cat_alert_tool.cat import Gender
+from cat_alert_tool.config import DB, ConfigSchema, Requests
+from cat_alert_tool.constants import (
+    DAYS_PER_MONTH,
+    DAYS_PER_WEEK,
+    DAYS_PER_YEAR,
+)
+from cat_alert_tool.fetch import (
+    get_cats,
+    parse_cat_age_string,
+    parse_gender_string,
+    parse_name_id_string,
+)
+
+LISTING = (
+    b'<html><body><div class="gridResult">'
+    b'<a href="detail.asp?ID=1"><img src="image.asp?ID=1"></a>'
+    b'<div class="gridText">CAT</div>'
+    b'<div class="gridText">Whiskers (A123456)</div>'
+    b'<div class="gridText">Male</div>'
+    b'<div class="gridText">Orange</div>'
+    b'<div class="gridText">Domestic Sh</div>'
+    b'<div class="gridText">2 years 3 months old</div>'
+    b'<div class="gridText">Ames</div>'
+    b"</div></body></html>"
+)
+
+
+@pytest.mark.parametrize(
+    ("name_id_string", "expected"),
+    [
+        ("Whiskers (A123456)", ("whiskers", "A123456")),
+        ("Mr Fluffy Pants (A9)", ("mr fluffy pants", "A9")),
+        ("Bob (Jr) (a77)", ("bob (jr)", "A77")),
+        ("Tab\t(A1)", ("", "")),
+        ("No Id", ("", "")),
+        ("", ("", "")),
+    ],
+)
+def test_parse_name_id_string(name_id_string: str, expected: tuple[str, str]):
+    assert parse_name_id_string(name_id_string) == expected
+
+
+@pytest.mark.parametrize(
+    ("age_string", "expected"),
+    [
+        ("2 years 3 months old", 2 * DAYS_PER_YEAR + 3 * DAYS_PER_MONTH),
+        ("2 YEARS 3 Months", 2 * DAYS_PER_YEAR + 3 * DAYS_PER_MONTH),
+        ("3 weeks", 3 * DAYS_PER_WEEK),
+        ("2 years old 1 year", 3 * DAYS_PER_YEAR),
+        ("unknown", 0),
+        ("", 0),
+    ],
+)
+def test_parse_cat_age_string(age_string: str, expected: int):
+    assert parse_cat_age_string(age_string) == expected
+
+
+@pytest.mark.parametrize(
+    ("gender_string", "expected"),
+    [
+        ("Male", Gender.MALE),
+        ("FEMALE", Gender.FEMALE),
+        ("unknown", None),
+        ("", None),
+    ],
+)
+def test_parse_gender_string(gender_string: str, expected: Gender | None):
+    assert parse_gender_string(gender_string) == expected
+
+
+class ShelterServer(ThreadingHTTPServer):
+    """Serve a scripted sequence of responses and count the requests."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), ShelterHandler)
+        self.responses: list[tuple[int, bytes, str]] = []
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/"
+
+
+class ShelterHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:  # noqa: N802
+        server = self.server
+        assert isinstance(server, ShelterServer)
+        status, body, content_type = server.responses[
+            min(server.requests, len(server.responses) - 1)
+        ]
+        server.requests += 1
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server() -> Iterator[ShelterServer]:
+    server = ShelterServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_config(url: str, fetch_attempts: int = 3) -> ConfigSchema:
+    return ConfigSchema(
+        requests=Requests(
+            base_url="https://petharbor.com/",
+            tracking_url=url,
+            fetch_timeout=5,
+            fetch_attempts=fetch_attempts,
+            fetch_sleep=2,
+        ),
+        db=DB(db_dir="db", db_name="cats.db"),
+    )
+
+
+def test_get_cats_parses_listing(server: ShelterServer):
+    server.responses = [(200, LISTING, "text/html; charset=utf-8")]
+
+    cats = get_cats(make_config(server.url))
+
+    assert len(cats) == 1
+    cat = cats[0]
+    assert cat.id == "A123456"
+    assert cat.name == "whiskers"
+    assert cat.url == "https://petharbor.com/detail.asp?ID=1"
+    assert cat.image == "https://petharbor.com/image.asp?ID=1"
+    assert cat.age == 2 * DAYS_PER_YEAR + 3 * DAYS_PER_MONTH
+
+
+def test_get_cats_retries_server_errors(
+    server: ShelterServer, mocker: MockerFixture
+):
+    sleep = mocker.patch("urllib3.util.retry.time.sleep")
+    server.responses = [
+        (503, b"", "text/plain"),
+        (500, b"", "text/plain"),
+        (200, LISTING, "text/html; charset=utf-8"),
+    ]
+
+    cats = get_cats(make_config(server.url))
+
+    assert len(cats) == 1
+    assert server.requests == len(server.responses)
+    assert [call.args for call in sleep.call_args_list] == [(2,), (2,)]
+
+
+def test_get_cats_does_not_retry_client_errors(
+    server: ShelterServer, mocker: MockerFixture
+):
+    sleep = mocker.patch("urllib3.util.retry.time.sleep")
+    server.responses = [(404, b"", "text/plain")]
+
+    assert get_cats(make_config(server.url)) == []
+    assert server.requests == 1
+    sleep.assert_not_called()
+
+
+def test_get_cats_gives_up_after_fetch_attempts(
+    server: ShelterServer, mocker: MockerFixture
+):
+    mocker.patch("urllib3.util.retry.time.sleep")
+    server.responses = [(503, b"", "text/plain")]
+    fetch_attempts = 4
+
+    assert get_cats(make_config(server.url, fetch_attempts)) == []
+    assert server.requests == fetch_attempts
+
+
+def test_get_cats_empty_page(server: ShelterServer):
+    server.responses = [(200, b"<html><body></body></html>", "text/html")]
+
+    assert get_cats(make_config(server.url)) == []
+
+
+@pytest.mark.parametrize(
+    ("content_type", "encoding"),
+    [
+        ("text/html; charset=utf-8", "utf-8"),
+        ("text/html; charset=windows-1252", "cp1252"),
+        ("text/html", "latin-1"),
+    ],
+)
+def test_get_cats_respects_declared_charset(
+    server: ShelterServer, content_type: str, encoding: str
+):
+    listing = LISTING.replace(b"Whiskers", "Renée".encode(encoding))
+    server.responses = [(200, listing, content_type)]
+
+    cats = get_cats(make_config(server.url))
+
+    assert cats[0].name == "renée"
+
+
+def test_get_cats_utf8_meta_without_declared_charset(server: ShelterServer):
+    listing = LISTING.replace(
+        b"<html>", b'<html><head><meta charset="utf-8"></head>'
+    ).replace(b"Whiskers", "Renée".encode())
+    server.responses = [(200, listing, "application/octet-stream")]
+
+    cats = get_cats(make_config(server.url))
+
+    assert cats[0].name == "renée"